@@ -86,18 +86,28 @@ pub async fn seed_brand_ethics(
     usage += curation_usage;
     tracing::info!(companies = curation.companies.len(), "companies curated");
 
+    // 3. Phase 2: Generate evidence for all companies concurrently. Done before
+    // any poll is created so an LLM failure leaves the room empty and resumable.
+    let evidence_results = llm::generate_company_evidence_batch(
+        http,
+        config,
+        curation
+            .companies
+            .iter()
+            .map(|c| (c.name.as_str(), c.ticker.as_str())),
+    )
+    .await?;
+
     // 4. For each company: create poll, dimensions, evidence
-    for (i, company) in curation.companies.iter().enumerate() {
+    for (i, (company, (evidence, ev_usage))) in
+        curation.companies.iter().zip(evidence_results).enumerate()
+    {
         tracing::info!(
             company = %company.name,
             ticker = %company.ticker,
             position = i,
             "seeding company poll..."
         );
-
-        // Phase 2: Generate evidence for this company
-        let (evidence, ev_usage) =
-            llm::generate_company_evidence(http, config, &company.name, &company.ticker).await?;
         usage += ev_usage;
 
         // Create poll (question = company name, description = relevance hook)
@@ -165,8 +175,8 @@ pub async fn seed_brand_ethics(
 ///
 /// Returns `Ok(Usage::default())` immediately if the room is not in the
 /// capacity list (meaning it still has active or draft polls). If the room
-/// does appear, all polls are reset to draft and their evidence is
-/// regenerated via LLM.
+/// does appear, evidence for all polls is regenerated via LLM concurrently,
+/// then each poll is reset to draft with its fresh evidence attached.
 ///
 /// # Errors
 ///
@@ -198,8 +208,20 @@ pub async fn refill_if_needed(
     let polls = client.list_polls(brand_room.id).await?;
     tracing::info!(poll_count = polls.len(), "polls to reset");
 
-    for poll in &polls {
-        // Delete stale evidence before regenerating
+    // Regenerate evidence for every poll concurrently before touching any of
+    // them, so an LLM failure leaves the room in its previous state.
+    // question IS the company name (see seed_brand_ethics)
+    let evidence_results = llm::generate_company_evidence_batch(
+        http,
+        config,
+        polls.iter().map(|p| (p.question.as_str(), "")),
+    )
+    .await?;
+
+    for (poll, (evidence, ev_usage)) in polls.iter().zip(evidence_results) {
+        usage += ev_usage;
+
+        // Delete stale evidence before attaching the fresh set
         client
             .delete_poll_evidence(admin, brand_room.id, poll.id)
             .await?;
@@ -207,11 +229,6 @@ pub async fn refill_if_needed(
         // Reset poll status to draft so the lifecycle queue can reactivate it
         client.reset_poll(admin, brand_room.id, poll.id).await?;
 
-        // question IS the company name (see seed_brand_ethics)
-        let (evidence, ev_usage) =
-            llm::generate_company_evidence(http, config, &poll.question, "").await?;
-        usage += ev_usage;
-
         // Fetch dimensions so we can attach evidence per dimension
         let detail = client.get_poll_detail(brand_room.id, poll.id).await?;
 
@@ -475,18 +492,20 @@ pub async fn dry_run(http: &reqwest::Client, config: &SimConfig) -> Result<(), a
 
     tracing::info!(companies = curation.companies.len(), "companies curated");
 
-    // Phase 2: Generate evidence for each company
-    let mut companies = Vec::with_capacity(curation.companies.len());
+    // Phase 2: Generate evidence for all companies concurrently
+    let evidence_results = llm::generate_company_evidence_batch(
+        http,
+        config,
+        curation
+            .companies
+            .iter()
+            .map(|c| (c.name.as_str(), c.ticker.as_str())),
+    )
+    .await?;
 
-    for company in &curation.companies {
-        tracing::info!(
-            company = %company.name,
-            ticker = %company.ticker,
-            "Phase 2: generating evidence..."
-        );
+    let mut companies = Vec::with_capacity(curation.companies.len());
 
-        let (evidence, ev_usage) =
-            llm::generate_company_evidence(http, config, &company.name, &company.ticker).await?;
+    for (company, (evidence, ev_usage)) in curation.companies.iter().zip(evidence_results) {
         total_usage += ev_usage;
 
         let dimensions: Vec<DryRunDimension> = DIMENSIONS
@@ -40,6 +40,11 @@ pub struct SimConfig {
     /// Number of companies to curate from the S&P 500 (used in `brand_ethics` mode)
     #[serde(default = "default_company_count")]
     pub company_count: usize,
+    /// Max companies whose evidence is generated at once (`brand_ethics` mode).
+    /// Each company runs 5 Exa searches concurrently, so peak Exa concurrency
+    /// is 5x this value. Values below 1 are treated as 1.
+    #[serde(default = "default_evidence_concurrency")]
+    pub evidence_concurrency: usize,
     /// Exa API key for evidence search (required for `brand_ethics` mode unless `mock_llm`)
     #[serde(default)]
     pub exa_api_key: String,
@@ -111,6 +116,10 @@ const fn default_company_count() -> usize {
     25
 }
 
+const fn default_evidence_concurrency() -> usize {
+    2
+}
+
 fn default_llm_base_url() -> String {
     "https://openrouter.ai/api/v1".to_string()
 }
@@ -163,6 +172,7 @@ mod tests {
             assert_eq!(config.voter_count, 20);
             assert_eq!(config.log_level, "info");
             assert_eq!(config.poll_duration_secs, 86400);
+            assert_eq!(config.evidence_concurrency, 2);
             Ok(())
         });
     }
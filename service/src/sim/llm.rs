@@ -633,6 +633,96 @@ pub async fn generate_company_evidence(
     Ok((evidence, usage))
 }
 
+/// Phase 2 for many companies: run [`generate_company_evidence`] concurrently.
+///
+/// Takes `(company_name, ticker)` pairs and returns results in the same order.
+/// Each pair is copied once, into the task that generates its evidence.
+/// At most `config.evidence_concurrency` companies are in flight at a time,
+/// so at most 5x that many Exa searches run concurrently.
+///
+/// # Errors
+///
+/// Returns the first error to complete (not necessarily the first company in
+/// input order); remaining tasks are aborted.
+pub async fn generate_company_evidence_batch<'a>(
+    client: &reqwest::Client,
+    config: &SimConfig,
+    companies: impl IntoIterator<Item = (&'a str, &'a str)>,
+) -> Result<Vec<(CompanyEvidence, Usage)>, anyhow::Error> {
+    let companies: Vec<(String, String)> = companies
+        .into_iter()
+        .map(|(company_name, ticker)| (company_name.to_string(), ticker.to_string()))
+        .collect();
+    tracing::info!(
+        companies = companies.len(),
+        "Phase 2: generating evidence..."
+    );
+
+    fan_out_bounded(
+        companies,
+        config.evidence_concurrency,
+        |(company_name, ticker)| {
+            let client = client.clone();
+            let config = config.clone();
+            async move { generate_company_evidence(&client, &config, &company_name, &ticker).await }
+        },
+    )
+    .await
+}
+
+/// Run `make_task(item)` for every item on a `JoinSet`, with at most `limit`
+/// tasks in flight (a `limit` of 0 is treated as 1). Outputs are returned in
+/// input order regardless of completion order.
+///
+/// Returns the first error to complete; remaining tasks are aborted when the
+/// `JoinSet` is dropped.
+async fn fan_out_bounded<I, T, F, Fut>(
+    items: Vec<I>,
+    limit: usize,
+    mut make_task: F,
+) -> Result<Vec<T>, anyhow::Error>
+where
+    F: FnMut(I) -> Fut,
+    Fut: std::future::Future<Output = Result<T, anyhow::Error>> + Send + 'static,
+    T: Send + 'static,
+{
+    let mut results: Vec<Option<T>> = Vec::new();
+    results.resize_with(items.len(), || None);
+
+    let limit = limit.max(1);
+    let mut join_set = tokio::task::JoinSet::new();
+    for (i, item) in items.into_iter().enumerate() {
+        if join_set.len() >= limit {
+            if let Some(joined) = join_set.join_next().await {
+                store_task_result(&mut results, joined)?;
+            }
+        }
+
+        let task = make_task(item);
+        join_set.spawn(async move { (i, task.await) });
+    }
+
+    while let Some(joined) = join_set.join_next().await {
+        store_task_result(&mut results, joined)?;
+    }
+
+    Ok(results.into_iter().flatten().collect())
+}
+
+/// Input index plus task result, as returned by each [`fan_out_bounded`] task.
+type TaskOutput<T> = (usize, Result<T, anyhow::Error>);
+
+/// Store a finished task's output at its input index, propagating both join
+/// failures (panic or cancellation) and task errors.
+fn store_task_result<T>(
+    results: &mut [Option<T>],
+    joined: Result<TaskOutput<T>, tokio::task::JoinError>,
+) -> Result<(), anyhow::Error> {
+    let (idx, result) = joined.map_err(|e| anyhow::anyhow!("evidence task failed: {e}"))?;
+    results[idx] = Some(result?);
+    Ok(())
+}
+
 const EXA_SYNTHESIS_SYSTEM: &str = r"You are a balanced research analyst extracting structured evidence from search results. For each of the 5 ethical dimensions, extract 2-3 specific, factual pro and con claims directly supported by the search results provided. Each claim must be one sentence and grounded in the sources — do not fabricate claims. If a dimension has weak search coverage, provide fewer claims rather than speculating.";
 
 fn build_exa_synthesis_messages(
@@ -872,9 +962,8 @@ mod tests {
         assert!(content.rooms.is_empty());
     }
 
-    #[tokio::test]
-    async fn generate_content_returns_mock_when_enabled() {
-        let config = SimConfig {
+    fn mock_sim_config() -> SimConfig {
+        SimConfig {
             api_url: "http://localhost:4000".to_string(),
             openrouter_api_key: String::new(),
             openrouter_model: "unused".to_string(),
@@ -887,6 +976,7 @@ mod tests {
             poll_duration_secs: 86400,
             room_topic: "civic".to_string(),
             company_count: 25,
+            evidence_concurrency: 2,
             dry_run: false,
             battery_config: None,
             battery_company: None,
@@ -895,7 +985,12 @@ mod tests {
             evidence_model: "deepseek/deepseek-v3.2".to_string(),
             llm_base_url: "https://openrouter.ai/api/v1".to_string(),
             exa_base_url: "https://api.exa.ai".to_string(),
-        };
+        }
+    }
+
+    #[tokio::test]
+    async fn generate_content_returns_mock_when_enabled() {
+        let config = mock_sim_config();
 
         let client = reqwest::Client::new();
         let (content, usage) = generate_content(&client, &config, 2).await.unwrap();
@@ -904,29 +999,103 @@ mod tests {
         assert_eq!(usage.total_tokens, 0, "mock should report zero tokens");
     }
 
+    #[tokio::test]
+    async fn generate_company_evidence_batch_returns_mock_evidence_per_company() {
+        let config = mock_sim_config();
+        let companies: Vec<(String, String)> = (0..12)
+            .map(|i| (format!("Company {i}"), format!("T{i}")))
+            .collect();
+
+        let client = reqwest::Client::new();
+        let pairs = companies.iter().map(|(n, t)| (n.as_str(), t.as_str()));
+        let results = generate_company_evidence_batch(&client, &config, pairs)
+            .await
+            .unwrap();
+
+        assert_eq!(results.len(), companies.len());
+        for ((name, _), (evidence, usage)) in companies.iter().zip(&results) {
+            assert!(
+                evidence.relevance_hook.starts_with(&format!("{name} ")),
+                "expected evidence for {name}, got: {}",
+                evidence.relevance_hook
+            );
+            assert_eq!(usage.total_tokens, 0, "mock should report zero tokens");
+        }
+    }
+
+    /// Runs `fan_out_bounded` over `n` items whose futures finish in reverse
+    /// input order, returning the outputs and peak number of tasks in flight.
+    async fn run_reverse_finishing(n: u64, limit: usize) -> (Vec<u64>, usize) {
+        use std::sync::atomic::{AtomicUsize, Ordering};
+        use std::sync::Arc;
+
+        let in_flight = Arc::new(AtomicUsize::new(0));
+        let peak = Arc::new(AtomicUsize::new(0));
+        let items: Vec<u64> = (0..n).collect();
+
+        let out = fan_out_bounded(items, limit, |i| {
+            let in_flight = Arc::clone(&in_flight);
+            let peak = Arc::clone(&peak);
+            async move {
+                let now = in_flight.fetch_add(1, Ordering::SeqCst) + 1;
+                peak.fetch_max(now, Ordering::SeqCst);
+                // Later items sleep less, so they finish first.
+                tokio::time::sleep(std::time::Duration::from_millis((n - i) * 5)).await;
+                in_flight.fetch_sub(1, Ordering::SeqCst);
+                Ok(i)
+            }
+        })
+        .await
+        .unwrap();
+
+        (out, peak.load(Ordering::SeqCst))
+    }
+
+    #[tokio::test]
+    async fn fan_out_bounded_preserves_input_order_and_bound() {
+        let (out, peak) = run_reverse_finishing(12, 3).await;
+        assert_eq!(out, (0..12).collect::<Vec<_>>());
+        assert_eq!(peak, 3, "should run exactly `limit` tasks concurrently");
+    }
+
+    #[tokio::test]
+    async fn fan_out_bounded_zero_limit_still_progresses() {
+        let (out, peak) = run_reverse_finishing(4, 0).await;
+        assert_eq!(out, (0..4).collect::<Vec<_>>());
+        assert_eq!(peak, 1, "limit 0 should be clamped to 1");
+    }
+
+    #[tokio::test]
+    async fn fan_out_bounded_propagates_task_error() {
+        let result = fan_out_bounded(vec![1, 2, 3], 2, |i| async move {
+            if i == 2 {
+                Err(anyhow::anyhow!("boom"))
+            } else {
+                Ok(i)
+            }
+        })
+        .await;
+        assert!(result.unwrap_err().to_string().contains("boom"));
+    }
+
+    #[tokio::test]
+    async fn generate_company_evidence_batch_empty_input() {
+        let config = mock_sim_config();
+        let client = reqwest::Client::new();
+        let results = generate_company_evidence_batch(&client, &config, std::iter::empty())
+            .await
+            .unwrap();
+        assert!(results.is_empty());
+    }
+
     #[test]
     fn builds_correct_messages() {
         let config = SimConfig {
-            api_url: "http://localhost:4000".to_string(),
             openrouter_api_key: "test-key".to_string(),
             openrouter_model: "test-model".to_string(),
-            target_rooms: 5,
-            votes_per_poll: 15,
             system_prompt: "You are a test system.".to_string(),
-            voter_count: 20,
-            log_level: "info".to_string(),
             mock_llm: false,
-            poll_duration_secs: 86400,
-            room_topic: "civic".to_string(),
-            company_count: 25,
-            dry_run: false,
-            battery_config: None,
-            battery_company: None,
-            battery_ticker: None,
-            exa_api_key: String::new(),
-            evidence_model: "deepseek/deepseek-v3.2".to_string(),
-            llm_base_url: "https://openrouter.ai/api/v1".to_string(),
-            exa_base_url: "https://api.exa.ai".to_string(),
+            ..mock_sim_config()
         };
 
         let messages = build_messages(&config, 2);